@@ -1,4 +1,4 @@
-import Database, { type Database as SqliteDatabase } from 'better-sqlite3';
+import Database, { type Database as SqliteDatabase, type Statement } from 'better-sqlite3';
 import { drizzle } from 'drizzle-orm/better-sqlite3';
 import path from 'path';
 import fs from 'fs';
@@ -8,6 +8,9 @@ import * as schema from './schema.js';
 let db: ReturnType<typeof drizzle<typeof schema>>;
 let sqlite: SqliteDatabase;
 
+// Prepared statements keyed by SQL text, so hot queries are compiled once
+const statementCache = new Map<string, Statement>();
+
 export function initializeDatabase() {
   // Ensure data directory exists
   const dbDir = path.dirname(config.databasePath);
@@ -19,6 +22,13 @@ export function initializeDatabase() {
   sqlite = new Database(config.databasePath);
   sqlite.pragma('journal_mode = WAL');
   sqlite.pragma('foreign_keys = ON');
+  // WAL keeps NORMAL durable against app crashes; skips an fsync per commit
+  sqlite.pragma('synchronous = NORMAL');
+  // Wait for a concurrent writer (backup script, seed) instead of failing with SQLITE_BUSY
+  sqlite.pragma('busy_timeout = 5000');
+  // 16MB page cache and in-memory temp tables for sorts/GROUP BY
+  sqlite.pragma('cache_size = -16000');
+  sqlite.pragma('temp_store = MEMORY');
 
   // Create Drizzle instance
   db = drizzle(sqlite, { schema });
@@ -104,9 +114,11 @@ function createTables() {
       attempted_at TEXT NOT NULL DEFAULT (datetime('now')),
       success INTEGER NOT NULL DEFAULT 0
     );
-    CREATE INDEX IF NOT EXISTS idx_login_attempts_email ON login_attempts(email);
+    CREATE INDEX IF NOT EXISTS idx_login_attempts_email_success_time ON login_attempts(email, success, attempted_at);
     CREATE INDEX IF NOT EXISTS idx_login_attempts_time ON login_attempts(attempted_at);
   `);
+  // Email-only index is superseded by the (email, success, attempted_at) composite above
+  sqlite.exec(`DROP INDEX IF EXISTS idx_login_attempts_email`);
 
   // Create audit_log table
   sqlite.exec(`
@@ -172,10 +184,14 @@ function createTables() {
   `);
 
   // Create indexes
+  // Status-only index is superseded by the (status, created_at) composite below
+  sqlite.exec(`DROP INDEX IF EXISTS idx_deck_requests_status`);
   sqlite.exec(`
     CREATE INDEX IF NOT EXISTS idx_deck_requests_order_number ON deck_requests(order_number);
     CREATE INDEX IF NOT EXISTS idx_deck_requests_email ON deck_requests(email);
-    CREATE INDEX IF NOT EXISTS idx_deck_requests_status ON deck_requests(status);
+    CREATE INDEX IF NOT EXISTS idx_deck_requests_created ON deck_requests(created_at);
+    CREATE INDEX IF NOT EXISTS idx_deck_requests_status_created ON deck_requests(status, created_at);
+    CREATE INDEX IF NOT EXISTS idx_deck_requests_status_updated ON deck_requests(status, updated_at);
     CREATE INDEX IF NOT EXISTS idx_deck_line_items_deck_request_id ON deck_line_items(deck_request_id);
     CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
   `);
@@ -203,4 +219,13 @@ export function getSqlite(): SqliteDatabase {
   return sqlite;
 }
 
+export function getStatement(sql: string): Statement {
+  let statement = statementCache.get(sql);
+  if (!statement) {
+    statement = getSqlite().prepare(sql);
+    statementCache.set(sql, statement);
+  }
+  return statement;
+}
+
 export { schema };
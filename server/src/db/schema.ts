@@ -1,4 +1,5 @@
 import { sqliteTable, text, integer, real } from 'drizzle-orm/sqlite-core';
+import { relations } from 'drizzle-orm';
 
 // Game types
 export const gameTypes = ['magic', 'onepiece', 'pokemon', 'other'] as const;
@@ -59,6 +60,18 @@ export const deckLineItems = sqliteTable('deck_line_items', {
 export type DeckLineItem = typeof deckLineItems.$inferSelect;
 export type NewDeckLineItem = typeof deckLineItems.$inferInsert;
 
+// Relations (used by relational queries to load an order with its items in one statement)
+export const deckRequestsRelations = relations(deckRequests, ({ many }) => ({
+  lineItems: many(deckLineItems),
+}));
+
+export const deckLineItemsRelations = relations(deckLineItems, ({ one }) => ({
+  deckRequest: one(deckRequests, {
+    fields: [deckLineItems.deckRequestId],
+    references: [deckRequests.id],
+  }),
+}));
+
 // Users table (for staff/admin)
 export const users = sqliteTable('users', {
   id: text('id').primaryKey(),
@@ -3,7 +3,7 @@ import bcrypt from 'bcrypt';
 import crypto from 'crypto';
 import { z } from 'zod';
 import { eq } from 'drizzle-orm';
-import { getDatabase, getSqlite } from '../db/index.js';
+import { getDatabase, getStatement } from '../db/index.js';
 import { users } from '../db/schema.js';
 import { requireAuth, requireAdmin, AuthRequest } from '../middleware/auth.js';
 import { logAudit } from '../services/auditService.js';
@@ -117,7 +117,7 @@ router.delete('/users/:id', (req: AuthRequest, res, next) => {
     db.delete(users).where(eq(users.id, userId)).run();
 
     // Clean up password reset tokens for deleted user
-    getSqlite().prepare('DELETE FROM password_reset_tokens WHERE user_id = ?').run(userId);
+    getStatement('DELETE FROM password_reset_tokens WHERE user_id = ?').run(userId);
 
     logAudit(req, {
       action: 'admin.delete_user',
@@ -5,7 +5,7 @@ import crypto from 'crypto';
 import { z } from 'zod';
 import { eq } from 'drizzle-orm';
 import { config } from '../config.js';
-import { getDatabase, getSqlite } from '../db/index.js';
+import { getDatabase, getSqlite, getStatement } from '../db/index.js';
 import { users, tokenBlacklist } from '../db/schema.js';
 import { requireAuth, AuthRequest } from '../middleware/auth.js';
 import { createError } from '../middleware/errorHandler.js';
@@ -51,10 +51,9 @@ router.post('/login', authRateLimiter, async (req, res, next) => {
   try {
     const { email, password } = loginSchema.parse(req.body);
     const db = getDatabase();
-    const sqliteDb = getSqlite();
 
     // Check account lockout
-    const recentFailures = sqliteDb.prepare(`
+    const recentFailures = getStatement(`
       SELECT COUNT(*) as count FROM login_attempts
       WHERE email = ? AND success = 0
       AND attempted_at > datetime('now', ?)
@@ -73,18 +72,14 @@ router.post('/login', authRateLimiter, async (req, res, next) => {
     const valid = await bcrypt.compare(password, hashToCompare);
 
     if (!valid || !user) {
-      sqliteDb.prepare(`INSERT INTO login_attempts (email, success) VALUES (?, 0)`)
-        .run(email.toLowerCase());
-      logAudit(req, { action: 'auth.login_failed', details: `email: ${email.toLowerCase()}` });
+      getSqlite().transaction(() => {
+        getStatement(`INSERT INTO login_attempts (email, success) VALUES (?, 0)`)
+          .run(email.toLowerCase());
+        logAudit(req, { action: 'auth.login_failed', details: `email: ${email.toLowerCase()}` });
+      })();
       return res.status(401).json({ error: 'Invalid credentials' });
     }
 
-    // Log successful attempt and clear old failures
-    sqliteDb.prepare(`INSERT INTO login_attempts (email, success) VALUES (?, 1)`)
-      .run(email.toLowerCase());
-    sqliteDb.prepare(`DELETE FROM login_attempts WHERE email = ? AND success = 0`)
-      .run(email.toLowerCase());
-
     const token = jwt.sign(
       {
         userId: user.id,
@@ -95,7 +90,14 @@ router.post('/login', authRateLimiter, async (req, res, next) => {
       { algorithm: 'HS256', expiresIn: config.jwtExpiry as jwt.SignOptions['expiresIn'] }
     );
 
-    logAudit(req, { action: 'auth.login', entityType: 'user', entityId: user.id });
+    // Log successful attempt, clear old failures and audit in a single commit
+    getSqlite().transaction(() => {
+      getStatement(`INSERT INTO login_attempts (email, success) VALUES (?, 1)`)
+        .run(email.toLowerCase());
+      getStatement(`DELETE FROM login_attempts WHERE email = ? AND success = 0`)
+        .run(email.toLowerCase());
+      logAudit(req, { action: 'auth.login', entityType: 'user', entityId: user.id });
+    })();
 
     res.json({
       token,
@@ -178,7 +180,6 @@ router.post('/request-reset', passwordResetRateLimiter, async (req, res, next) =
   try {
     const { email } = requestResetSchema.parse(req.body);
     const db = getDatabase();
-    const sqliteDb = getSqlite();
 
     // Always return success to prevent email enumeration
     const successResponse = { message: 'If an account exists with that email, a password reset link has been sent.' };
@@ -191,7 +192,7 @@ router.post('/request-reset', passwordResetRateLimiter, async (req, res, next) =
     }
 
     // Invalidate previous tokens for this user
-    sqliteDb.prepare(`UPDATE password_reset_tokens SET used_at = datetime('now') WHERE user_id = ? AND used_at IS NULL`)
+    getStatement(`UPDATE password_reset_tokens SET used_at = datetime('now') WHERE user_id = ? AND used_at IS NULL`)
       .run(user.id);
 
     // Generate 32-byte random token (hex = 64 chars)
@@ -201,7 +202,7 @@ router.post('/request-reset', passwordResetRateLimiter, async (req, res, next) =
 
     const expiresAt = new Date(Date.now() + 60 * 60 * 1000).toISOString().replace('T', ' ').replace('Z', '').slice(0, 19);
 
-    sqliteDb.prepare(`
+    getStatement(`
       INSERT INTO password_reset_tokens (user_id, token_hash, expires_at, created_at)
       VALUES (?, ?, ?, datetime('now'))
     `).run(user.id, tokenHash, expiresAt);
@@ -224,12 +225,11 @@ router.post('/request-reset', passwordResetRateLimiter, async (req, res, next) =
 router.post('/reset-password', passwordResetRateLimiter, async (req, res, next) => {
   try {
     const { token, newPassword } = resetPasswordSchema.parse(req.body);
-    const sqliteDb = getSqlite();
     const db = getDatabase();
 
     const tokenHash = crypto.createHash('sha256').update(token).digest('hex');
 
-    const resetToken = sqliteDb.prepare(`
+    const resetToken = getStatement(`
       SELECT * FROM password_reset_tokens
       WHERE token_hash = ? AND used_at IS NULL AND expires_at > datetime('now')
     `).get(tokenHash) as { id: number; user_id: string; token_hash: string; expires_at: string; used_at: string | null } | undefined;
@@ -239,7 +239,7 @@ router.post('/reset-password', passwordResetRateLimiter, async (req, res, next)
     }
 
     // Mark token as used
-    sqliteDb.prepare(`UPDATE password_reset_tokens SET used_at = datetime('now') WHERE id = ?`)
+    getStatement(`UPDATE password_reset_tokens SET used_at = datetime('now') WHERE id = ?`)
       .run(resetToken.id);
 
     // Update user password
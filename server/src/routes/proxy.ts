@@ -1,11 +1,45 @@
 import { Router } from 'express';
 import { z } from 'zod';
 import { proxyRateLimiter } from '../middleware/rateLimiter.js';
+import { requireAuth, requireStaff } from '../middleware/auth.js';
+import { forEachWithConcurrency } from '../utils/concurrency.js';
 
 const router = Router();
 
 const TCGDEX_BASE_URL = 'https://api.tcgdex.net/v2/en';
 
+// In-memory cache of normalized TCGdex responses, so many staff/customers
+// looking up the same card collapse into one upstream fetch
+const SEARCH_CACHE_TTL_MS = 10 * 60 * 1000; // 10 minutes
+const CARD_CACHE_TTL_MS = 24 * 60 * 60 * 1000; // 24 hours
+const MAX_CACHE_SIZE = 1000;
+
+interface CacheEntry {
+  data: { cards: NormalizedCard[] };
+  expiresAt: number;
+}
+
+const responseCache = new Map<string, CacheEntry>();
+
+function getCached(key: string): { cards: NormalizedCard[] } | undefined {
+  const entry = responseCache.get(key);
+  if (!entry) return undefined;
+  if (entry.expiresAt < Date.now()) {
+    responseCache.delete(key);
+    return undefined;
+  }
+  return entry.data;
+}
+
+function setCached(key: string, data: { cards: NormalizedCard[] }, ttlMs: number) {
+  responseCache.set(key, { data, expiresAt: Date.now() + ttlMs });
+  // Evict oldest entry (Map preserves insertion order)
+  if (responseCache.size > MAX_CACHE_SIZE) {
+    const oldest = responseCache.keys().next().value;
+    if (oldest !== undefined) responseCache.delete(oldest);
+  }
+}
+
 interface TCGdexCard {
   id: string;
   localId: string;
@@ -39,6 +73,29 @@ function normalizeCard(card: TCGdexCard): NormalizedCard {
   };
 }
 
+const UPSTREAM_TIMEOUT_MS = 15000;
+// TCGdex has no batch endpoint, so batch searches fan out with this many lookups in flight
+const BATCH_CONCURRENCY = 5;
+
+// Name search shared by the single and batch endpoints, served from cache when possible
+async function searchCards(query: string, signal: AbortSignal): Promise<{ cards: NormalizedCard[] }> {
+  const cacheKey = `search:${query}`;
+  const cached = getCached(cacheKey);
+  if (cached) return cached;
+
+  const url = `${TCGDEX_BASE_URL}/cards?name=${encodeURIComponent(query)}`;
+  const response = await fetch(url, { signal });
+
+  if (!response.ok) {
+    return { cards: [] };
+  }
+
+  const cards = (await response.json()) as TCGdexCard[];
+  const data = { cards: Array.isArray(cards) ? cards.slice(0, 20).map(normalizeCard) : [] };
+  setCached(cacheKey, data, SEARCH_CACHE_TTL_MS);
+  return data;
+}
+
 const searchSchema = z.object({
   action: z.enum(['search', 'card']),
   query: z.string().max(200).optional(),
@@ -48,29 +105,25 @@ const searchSchema = z.object({
 // GET /api/proxy/pokemon-tcg - Proxy requests to TCGdex API
 router.get('/pokemon-tcg', proxyRateLimiter, async (req, res) => {
   const controller = new AbortController();
-  const timeout = setTimeout(() => controller.abort(), 15000);
+  const timeout = setTimeout(() => controller.abort(), UPSTREAM_TIMEOUT_MS);
 
   try {
     const params = searchSchema.parse(req.query);
 
-    let url: string;
     let responseData: { cards: NormalizedCard[] } = { cards: [] };
 
     if (params.action === 'search' && params.query) {
       // Search for cards by name
-      url = `${TCGDEX_BASE_URL}/cards?name=${encodeURIComponent(params.query)}`;
-
-      const response = await fetch(url, { signal: controller.signal });
-
-      if (!response.ok) {
-        return res.json({ cards: [] });
+      responseData = await searchCards(params.query, controller.signal);
+    } else if (params.action === 'card' && params.id) {
+      const cacheKey = `card:${params.id}`;
+      const cached = getCached(cacheKey);
+      if (cached) {
+        return res.json(cached);
       }
 
-      const cards = (await response.json()) as TCGdexCard[];
-      responseData.cards = Array.isArray(cards) ? cards.slice(0, 20).map(normalizeCard) : [];
-    } else if (params.action === 'card' && params.id) {
       // Get specific card by ID
-      url = `${TCGDEX_BASE_URL}/cards/${encodeURIComponent(params.id)}`;
+      const url = `${TCGDEX_BASE_URL}/cards/${encodeURIComponent(params.id)}`;
 
       const response = await fetch(url, { signal: controller.signal });
 
@@ -80,6 +133,7 @@ router.get('/pokemon-tcg', proxyRateLimiter, async (req, res) => {
 
       const card = (await response.json()) as TCGdexCard;
       responseData.cards = [normalizeCard(card)];
+      setCached(cacheKey, responseData, CARD_CACHE_TTL_MS);
     }
 
     res.json(responseData);
@@ -92,4 +146,50 @@ router.get('/pokemon-tcg', proxyRateLimiter, async (req, res) => {
   }
 });
 
+// Entries are checked one by one below, so a single bad name can't reject the whole batch
+const batchSearchSchema = z.object({
+  queries: z.array(z.unknown()).min(1).max(100),
+});
+
+const batchQuerySchema = z.string().min(1).max(200);
+
+// POST /api/proxy/pokemon-tcg/batch - Search many card names in one request
+// Staff only: one batch fans out to up to 100 upstream lookups but counts once against the rate limit
+router.post('/pokemon-tcg/batch', requireAuth, requireStaff, proxyRateLimiter, async (req, res) => {
+  try {
+    const { queries } = batchSearchSchema.parse(req.body);
+    // Null prototype so card names like "__proto__" are stored as ordinary keys
+    const results: Record<string, NormalizedCard[]> = Object.create(null);
+
+    // Invalid names get an empty result instead of an upstream lookup
+    const uniqueQueries: string[] = [];
+    for (const query of new Set(queries)) {
+      if (batchQuerySchema.safeParse(query).success) {
+        uniqueQueries.push(query as string);
+      } else if (typeof query === 'string') {
+        results[query] = [];
+      }
+    }
+
+    await forEachWithConcurrency(uniqueQueries, BATCH_CONCURRENCY, async (query) => {
+      // Each lookup gets its own timeout so one slow name can't sink the whole batch
+      const controller = new AbortController();
+      const timeout = setTimeout(() => controller.abort(), UPSTREAM_TIMEOUT_MS);
+      try {
+        results[query] = (await searchCards(query, controller.signal)).cards;
+      } catch (err) {
+        console.error('Pokemon TCG proxy error:', err);
+        results[query] = [];
+      } finally {
+        clearTimeout(timeout);
+      }
+    });
+
+    res.json({ results });
+  } catch (err) {
+    console.error('Pokemon TCG batch proxy error:', err);
+    res.json({ results: {} });
+  }
+});
+
 export default router;
@@ -8,12 +8,14 @@ import {
   getOrderWithItems,
   updateOrder,
   updateLineItem,
+  updateLineItems,
   deleteLineItem,
-  getLineItemById,
+  getOrderLineItem,
   getLineItemsByOrderId,
 } from '../services/orderService.js';
 import { requestStatuses } from '../db/schema.js';
 import { logAudit } from '../services/auditService.js';
+import { getSqlite } from '../db/index.js';
 
 const router = Router();
 
@@ -72,13 +74,17 @@ router.patch('/orders/:id', (req, res, next) => {
       return next(createError('Order not found', 404, 'ORDER_NOT_FOUND'));
     }
 
-    const updated = updateOrder(id, updates);
-    logAudit(req, {
-      action: 'order.update',
-      entityType: 'order',
-      entityId: id,
-      details: JSON.stringify(updates),
-    });
+    // Commit the change and its audit row together
+    const updated = getSqlite().transaction(() => {
+      const result = updateOrder(id, updates, order);
+      logAudit(req, {
+        action: 'order.update',
+        entityType: 'order',
+        entityId: id,
+        details: JSON.stringify(updates),
+      });
+      return result;
+    })();
     res.json({ order: updated });
   } catch (err) {
     next(err);
@@ -98,31 +104,71 @@ const updateLineItemSchema = z.object({
   cardName: z.string().min(1).max(200).optional(),
 });
 
+const bulkUpdateLineItemsSchema = z.object({
+  items: z.array(updateLineItemSchema.extend({ id: z.string().min(1) })).min(1).max(500),
+});
+
+// PATCH /api/staff/orders/:orderId/items - Update many line items at once
+router.patch('/orders/:orderId/items', (req, res, next) => {
+  try {
+    const { orderId } = req.params;
+    const { items } = bulkUpdateLineItemsSchema.parse(req.body);
+
+    const order = getOrderById(orderId);
+    if (!order) {
+      return next(createError('Order not found', 404, 'ORDER_NOT_FOUND'));
+    }
+
+    // Verify every item belongs to this order before writing any of them
+    const orderItemIds = new Set(getLineItemsByOrderId(orderId).map(item => item.id));
+    if (items.some(item => !orderItemIds.has(item.id))) {
+      return next(createError('Line item not found', 404, 'ITEM_NOT_FOUND'));
+    }
+
+    const lineItems = getSqlite().transaction(() => {
+      const result = updateLineItems(orderId, items);
+      // Same per-item audit rows as the single-item route, so saved prices and quantities stay traceable
+      for (const { id: itemId, ...updates } of items) {
+        logAudit(req, {
+          action: 'lineitem.update',
+          entityType: 'lineitem',
+          entityId: itemId,
+          details: JSON.stringify(updates),
+        });
+      }
+      return result;
+    })();
+    res.json({ lineItems });
+  } catch (err) {
+    next(err);
+  }
+});
+
 // PATCH /api/staff/orders/:orderId/items/:itemId - Update line item
 router.patch('/orders/:orderId/items/:itemId', (req, res, next) => {
   try {
     const { orderId, itemId } = req.params;
     const updates = updateLineItemSchema.parse(req.body);
 
-    // Verify order exists
-    const order = getOrderById(orderId);
-    if (!order) {
+    // Verify order exists and item belongs to it
+    const found = getOrderLineItem(orderId, itemId);
+    if (!found) {
       return next(createError('Order not found', 404, 'ORDER_NOT_FOUND'));
     }
-
-    // Verify item exists and belongs to order
-    const item = getLineItemById(itemId);
-    if (!item || item.deckRequestId !== orderId) {
+    if (!found.lineItem) {
       return next(createError('Line item not found', 404, 'ITEM_NOT_FOUND'));
     }
 
-    const updated = updateLineItem(itemId, updates);
-    logAudit(req, {
-      action: 'lineitem.update',
-      entityType: 'lineitem',
-      entityId: itemId,
-      details: JSON.stringify(updates),
-    });
+    const updated = getSqlite().transaction(() => {
+      const result = updateLineItem(itemId, updates);
+      logAudit(req, {
+        action: 'lineitem.update',
+        entityType: 'lineitem',
+        entityId: itemId,
+        details: JSON.stringify(updates),
+      });
+      return result;
+    })();
     res.json({ lineItem: updated });
   } catch (err) {
     next(err);
@@ -134,28 +180,30 @@ router.delete('/orders/:orderId/items/:itemId', (req, res, next) => {
   try {
     const { orderId, itemId } = req.params;
 
-    // Verify order exists
-    const order = getOrderById(orderId);
-    if (!order) {
+    // Verify order exists and item belongs to it
+    const found = getOrderLineItem(orderId, itemId);
+    if (!found) {
       return next(createError('Order not found', 404, 'ORDER_NOT_FOUND'));
     }
-
-    // Verify item exists and belongs to order
-    const item = getLineItemById(itemId);
-    if (!item || item.deckRequestId !== orderId) {
+    if (!found.lineItem) {
       return next(createError('Line item not found', 404, 'ITEM_NOT_FOUND'));
     }
 
-    const deleted = deleteLineItem(itemId);
+    const deleted = getSqlite().transaction(() => {
+      const removed = deleteLineItem(itemId);
+      if (removed) {
+        logAudit(req, {
+          action: 'lineitem.delete',
+          entityType: 'lineitem',
+          entityId: itemId,
+        });
+      }
+      return removed;
+    })();
     if (!deleted) {
       return next(createError('Failed to delete line item', 500));
     }
 
-    logAudit(req, {
-      action: 'lineitem.delete',
-      entityType: 'lineitem',
-      entityId: itemId,
-    });
     res.json({ success: true });
   } catch (err) {
     next(err);
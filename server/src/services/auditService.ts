@@ -1,5 +1,4 @@
-import { getDatabase } from '../db/index.js';
-import * as schema from '../db/schema.js';
+import { getStatement } from '../db/index.js';
 import { Request } from 'express';
 import { AuthRequest } from '../middleware/auth.js';
 
@@ -11,16 +10,20 @@ interface AuditEntry {
 }
 
 export function logAudit(req: Request, entry: AuditEntry) {
-  const db = getDatabase();
   const userId = (req as AuthRequest).user?.id || null;
   const ipAddress = req.ip || req.socket.remoteAddress || 'unknown';
 
-  db.insert(schema.auditLog).values({
+  // Audit rows are written on every staff mutation, so skip the query builder and reuse one prepared insert
+  getStatement(`
+    INSERT INTO audit_log (user_id, action, entity_type, entity_id, details, ip_address, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+  `).run(
     userId,
-    action: entry.action,
-    entityType: entry.entityType || null,
-    entityId: entry.entityId || null,
-    details: entry.details || null,
+    entry.action,
+    entry.entityType || null,
+    entry.entityId || null,
+    entry.details || null,
     ipAddress,
-  }).run();
+    new Date().toISOString(),
+  );
 }
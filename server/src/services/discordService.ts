@@ -1,5 +1,5 @@
 import { config } from '../config.js';
-import { getSqlite } from '../db/index.js';
+import { getStatement } from '../db/index.js';
 
 interface DiscordEmbed {
   title: string;
@@ -15,6 +15,10 @@ const COLORS = {
   red: 0xef4444,
 };
 
+// Built once and reused; toLocaleDateString constructs a new formatter on every call
+const shortDateFormatter = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+const digestDateFormatter = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
+
 async function sendWebhook(embeds: DiscordEmbed[]): Promise<boolean> {
   const url = config.discord.webhookUrl;
   if (!url) return false;
@@ -42,8 +46,8 @@ async function sendWebhook(embeds: DiscordEmbed[]): Promise<boolean> {
   return false;
 }
 
-function formatTimeAgo(dateStr: string): string {
-  const diff = Date.now() - new Date(dateStr).getTime();
+function formatTimeAgo(dateStr: string, now: number): string {
+  const diff = now - new Date(dateStr).getTime();
   const hours = Math.floor(diff / (1000 * 60 * 60));
   if (hours < 24) return `${hours}h ago`;
   const days = Math.floor(hours / 24);
@@ -51,22 +55,32 @@ function formatTimeAgo(dateStr: string): string {
 }
 
 function formatDate(dateStr: string): string {
-  return new Date(dateStr).toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
+  return shortDateFormatter.format(new Date(dateStr));
 }
 
 export async function sendDailyDigest() {
   if (!config.discord.webhookUrl) return;
 
-  const sqlite = getSqlite();
+  // Read the clock once so every row in the digest is measured from the same instant
+  const now = new Date();
+  const timestamp = now.toISOString();
+
+  const statusRows = getStatement(`
+    SELECT status, COUNT(*) as c
+    FROM deck_requests
+    WHERE status IN ('submitted', 'in_progress', 'ready')
+    GROUP BY status
+  `).all() as { status: string; c: number }[];
+  const byStatus = new Map(statusRows.map(row => [row.status, row.c]));
 
   const counts = {
-    submitted: (sqlite.prepare(`SELECT COUNT(*) as c FROM deck_requests WHERE status = 'submitted'`).get() as { c: number }).c,
-    inProgress: (sqlite.prepare(`SELECT COUNT(*) as c FROM deck_requests WHERE status = 'in_progress'`).get() as { c: number }).c,
-    ready: (sqlite.prepare(`SELECT COUNT(*) as c FROM deck_requests WHERE status = 'ready'`).get() as { c: number }).c,
+    submitted: byStatus.get('submitted') ?? 0,
+    inProgress: byStatus.get('in_progress') ?? 0,
+    ready: byStatus.get('ready') ?? 0,
   };
 
   const staleHours = config.discord.staleOrderHours;
-  const staleOrders = sqlite.prepare(`
+  const staleOrders = getStatement(`
     SELECT order_number, customer_name, game, created_at
     FROM deck_requests
     WHERE status = 'submitted'
@@ -75,7 +89,7 @@ export async function sendDailyDigest() {
   `).all(`-${staleHours} hours`) as { order_number: string; customer_name: string; game: string; created_at: string }[];
 
   const holdDays = config.orderHoldDays;
-  const stalePickups = sqlite.prepare(`
+  const stalePickups = getStatement(`
     SELECT order_number, customer_name, game, email, phone, updated_at
     FROM deck_requests
     WHERE status = 'ready'
@@ -89,7 +103,7 @@ export async function sendDailyDigest() {
       title: 'LaunchList Daily Digest',
       description: 'No pending orders — all caught up!',
       color: COLORS.green,
-      timestamp: new Date().toISOString(),
+      timestamp,
     }]);
     return;
   }
@@ -105,7 +119,7 @@ export async function sendDailyDigest() {
 
   if (staleOrders.length > 0) {
     let lines = staleOrders.map(o =>
-      `• **${o.order_number}** — "${o.customer_name}" — ${o.game} (submitted ${formatTimeAgo(o.created_at)})`
+      `• **${o.order_number}** — "${o.customer_name}" — ${o.game} (submitted ${formatTimeAgo(o.created_at, now.getTime())})`
     ).join('\n');
     let value = lines;
     if (value.length > 1024) {
@@ -139,33 +153,36 @@ export async function sendDailyDigest() {
   }
 
   await sendWebhook([{
-    title: `LaunchList Daily Digest — ${new Date().toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' })}`,
+    title: `LaunchList Daily Digest — ${digestDateFormatter.format(now)}`,
     description: `${total} total active order${total === 1 ? '' : 's'}`,
     color,
     fields,
-    timestamp: new Date().toISOString(),
+    timestamp,
   }]);
 }
 
 export async function checkStaleOrders() {
   if (!config.discord.webhookUrl) return;
 
-  const sqlite = getSqlite();
+  const now = new Date();
+  const timestamp = now.toISOString();
+
   const staleHours = config.discord.staleOrderHours;
 
-  // Stale submitted orders (not yet alerted)
-  const staleOrders = sqlite.prepare(`
-    SELECT id, order_number, customer_name, email, phone, game, created_at
-    FROM deck_requests
-    WHERE status = 'submitted'
-    AND stale_alert_sent = 0
-    AND created_at < datetime('now', ?)
-  `).all(`-${staleHours} hours`) as { id: string; order_number: string; customer_name: string; email: string; phone: string | null; game: string; created_at: string }[];
+  // Stale submitted orders (not yet alerted), with line item counts joined in
+  const staleOrders = getStatement(`
+    SELECT r.id, r.order_number, r.customer_name, r.email, r.phone, r.game, r.created_at,
+      COUNT(li.id) as item_count
+    FROM deck_requests r
+    LEFT JOIN deck_line_items li ON li.deck_request_id = r.id
+    WHERE r.status = 'submitted'
+    AND r.stale_alert_sent = 0
+    AND r.created_at < datetime('now', ?)
+    GROUP BY r.id
+  `).all(`-${staleHours} hours`) as { id: string; order_number: string; customer_name: string; email: string; phone: string | null; game: string; created_at: string; item_count: number }[];
 
   for (const order of staleOrders) {
-    const itemCount = (sqlite.prepare(
-      `SELECT COUNT(*) as c FROM deck_line_items WHERE deck_request_id = ?`
-    ).get(order.id) as { c: number }).c;
+    const itemCount = order.item_count;
 
     const sent = await sendWebhook([{
       title: `🚨 Order ${order.order_number} has been waiting over ${staleHours} hours`,
@@ -175,21 +192,21 @@ export async function checkStaleOrders() {
         { name: 'Customer', value: order.customer_name, inline: true },
         { name: 'Game', value: order.game, inline: true },
         { name: 'Cards', value: `${itemCount} items`, inline: true },
-        { name: 'Submitted', value: formatTimeAgo(order.created_at) },
+        { name: 'Submitted', value: formatTimeAgo(order.created_at, now.getTime()) },
         { name: 'Contact', value: order.phone ? `${order.email} / ${order.phone}` : order.email },
       ],
-      timestamp: new Date().toISOString(),
+      timestamp,
     }]);
 
-    // Only mark as alerted if webhook succeeded
+    // Only mark as alerted if webhook succeeded, and right away so a crash mid-loop can't resend it
     if (sent) {
-      sqlite.prepare(`UPDATE deck_requests SET stale_alert_sent = 1 WHERE id = ?`).run(order.id);
+      getStatement(`UPDATE deck_requests SET stale_alert_sent = 1 WHERE id = ?`).run(order.id);
     }
   }
 
   // Stale pickups (not yet alerted)
   const holdDays = config.orderHoldDays;
-  const stalePickups = sqlite.prepare(`
+  const stalePickups = getStatement(`
     SELECT id, order_number, customer_name, email, phone, game, updated_at
     FROM deck_requests
     WHERE status = 'ready'
@@ -208,11 +225,11 @@ export async function checkStaleOrders() {
         { name: 'Ready since', value: formatDate(order.updated_at), inline: true },
         { name: 'Contact', value: order.phone ? `${order.email} / ${order.phone}` : order.email },
       ],
-      timestamp: new Date().toISOString(),
+      timestamp,
     }]);
 
     if (sent) {
-      sqlite.prepare(`UPDATE deck_requests SET pickup_alert_sent = 1 WHERE id = ?`).run(order.id);
+      getStatement(`UPDATE deck_requests SET pickup_alert_sent = 1 WHERE id = ?`).run(order.id);
     }
   }
 }
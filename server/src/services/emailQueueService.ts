@@ -1,14 +1,26 @@
-import { getDatabase, getSqlite } from '../db/index.js';
+import { getDatabase, getStatement } from '../db/index.js';
 import * as schema from '../db/schema.js';
+import { DeckRequest, DeckLineItem } from '../db/schema.js';
 import { eq } from 'drizzle-orm';
 import { sendConfirmationEmail, sendReadyEmail } from './emailService.js';
-import { getOrderWithItems } from './orderService.js';
+import { getOrdersWithItems } from './orderService.js';
+import { forEachWithConcurrency } from '../utils/concurrency.js';
 
 const MAX_ATTEMPTS = 3;
+// Matches nodemailer's default pool size so each worker can hold its own SMTP connection
+const SEND_CONCURRENCY = 5;
+
+type EmailTemplate = 'confirmation' | 'ready';
+
+// Template name -> sender, looked up once per queued email
+const TEMPLATE_SENDERS: Record<EmailTemplate, (order: DeckRequest, lineItems: DeckLineItem[]) => Promise<boolean>> = {
+  confirmation: sendConfirmationEmail,
+  ready: sendReadyEmail,
+};
 
 let processing = false;
 
-export function enqueueEmail(orderId: string, recipient: string, template: 'confirmation' | 'ready') {
+export function enqueueEmail(orderId: string, recipient: string, template: EmailTemplate) {
   const db = getDatabase();
   db.insert(schema.emailQueue).values({ orderId, recipient, template }).run();
 }
@@ -23,28 +35,31 @@ export async function processEmailQueue() {
       .where(eq(schema.emailQueue.status, 'pending'))
       .all();
 
-    for (const entry of pending) {
-      await processEmail(entry);
-    }
+    const orders = getOrdersWithItems(pending.map(entry => entry.orderId));
+
+    // A few sends run at once so SMTP round-trips overlap
+    await forEachWithConcurrency(pending, SEND_CONCURRENCY, entry =>
+      processEmail(entry, orders.get(entry.orderId))
+    );
   } finally {
     processing = false;
   }
 }
 
-async function processEmail(entry: typeof schema.emailQueue.$inferSelect) {
+async function processEmail(
+  entry: typeof schema.emailQueue.$inferSelect,
+  result: { order: DeckRequest; lineItems: DeckLineItem[] } | undefined
+) {
   const db = getDatabase();
   try {
-    const result = getOrderWithItems(String(entry.orderId));
     if (!result) throw new Error(`Order ${entry.orderId} not found`);
 
     const { order, lineItems } = result;
 
-    let sent = false;
-    if (entry.template === 'confirmation') {
-      sent = await sendConfirmationEmail(order, lineItems);
-    } else if (entry.template === 'ready') {
-      sent = await sendReadyEmail(order, lineItems);
-    }
+    const send = TEMPLATE_SENDERS[entry.template as EmailTemplate];
+    if (!send) throw new Error(`Unknown email template '${entry.template}'`);
+
+    const sent = await send(order, lineItems);
     if (!sent) {
       throw new Error('Email delivery failed or SMTP not configured');
     }
@@ -67,7 +82,7 @@ async function processEmail(entry: typeof schema.emailQueue.$inferSelect) {
 export function cleanupOldEmails() {
   const db = getDatabase();
   const cutoff = new Date(Date.now() - 30 * 24 * 60 * 60 * 1000).toISOString();
-  getSqlite().prepare(
+  getStatement(
     `DELETE FROM email_queue WHERE status IN ('sent', 'failed') AND created_at < ?`
   ).run(cutoff);
 }
@@ -3,6 +3,14 @@ import { config } from '../config.js';
 import { DeckRequest, DeckLineItem, ConditionVariant } from '../db/schema.js';
 import { escapeHtml } from '../utils/html.js';
 
+// Store details are fixed for the life of the process, so escape them once
+const safeStore = {
+  name: escapeHtml(config.store.name),
+  address: config.store.address ? escapeHtml(config.store.address) : '',
+  email: config.store.email ? escapeHtml(config.store.email) : '',
+  phone: config.store.phone ? escapeHtml(config.store.phone) : '',
+};
+
 interface EmailOptions {
   to: string;
   subject: string;
@@ -21,6 +29,8 @@ function getTransporter(): nodemailer.Transporter | null {
 
   if (!transporter) {
     transporter = nodemailer.createTransport({
+      // Reuse SMTP connections across messages instead of a new TCP+TLS handshake per email
+      pool: true,
       host: config.smtp.host,
       port: config.smtp.port,
       secure: config.smtp.secure,
@@ -124,9 +134,7 @@ export async function sendConfirmationEmail(
   const safeFormat = order.format ? escapeHtml(order.format) : '';
   const safePickupWindow = order.pickupWindow ? escapeHtml(order.pickupWindow) : '';
   const safeNotes = order.notes ? escapeHtml(order.notes) : '';
-  const safeStoreName = escapeHtml(config.store.name);
-  const safeStoreAddress = config.store.address ? escapeHtml(config.store.address) : '';
-  const safeStorePhone = config.store.phone ? escapeHtml(config.store.phone) : '';
+  const { name: safeStoreName, address: safeStoreAddress, phone: safeStorePhone } = safeStore;
 
   const subject = `Order Confirmation - ${order.orderNumber}`;
 
@@ -196,10 +204,7 @@ export async function sendReadyEmail(
   const safeCustomerName = escapeHtml(order.customerName);
   const safeOrderNumber = escapeHtml(order.orderNumber);
   const safeMissingItems = order.missingItems ? escapeHtml(order.missingItems) : '';
-  const safeStoreName = escapeHtml(config.store.name);
-  const safeStoreAddress = config.store.address ? escapeHtml(config.store.address) : '';
-  const safeStoreEmail = config.store.email ? escapeHtml(config.store.email) : '';
-  const safeStorePhone = config.store.phone ? escapeHtml(config.store.phone) : '';
+  const { name: safeStoreName, address: safeStoreAddress, email: safeStoreEmail, phone: safeStorePhone } = safeStore;
 
   const subject = `Your Order is Ready! - ${order.orderNumber}`;
 
@@ -1,7 +1,7 @@
 import { v4 as uuidv4 } from 'uuid';
 import crypto from 'crypto';
-import { eq, and, desc } from 'drizzle-orm';
-import { getDatabase, getSqlite } from '../db/index.js';
+import { eq, and, desc, inArray, getTableColumns } from 'drizzle-orm';
+import { getDatabase, getSqlite, getStatement } from '../db/index.js';
 import { deckRequests, deckLineItems, DeckRequest, DeckLineItem, NewDeckRequest, NewDeckLineItem, GameType, RequestStatus, NotifyMethod } from '../db/schema.js';
 import * as schema from '../db/schema.js';
 import { config } from '../config.js';
@@ -61,7 +61,7 @@ export async function createOrder(input: CreateOrderInput): Promise<{ order: Dec
 
       const result = sqliteDb.transaction(() => {
         // Insert order
-        db.insert(deckRequests).values({
+        const order = db.insert(deckRequests).values({
           id: orderId,
           orderNumber,
           customerName: input.customerName,
@@ -76,25 +76,20 @@ export async function createOrder(input: CreateOrderInput): Promise<{ order: Dec
           status: 'submitted',
           createdAt: now,
           updatedAt: now,
-        }).run();
+        }).returning().get();
 
-        // Insert line items
-        for (const item of input.lineItems) {
-          const itemId = uuidv4();
-          db.insert(deckLineItems).values({
-            id: itemId,
+        // Insert all line items in a single multi-row statement
+        const items = db.insert(deckLineItems).values(
+          input.lineItems.map(item => ({
+            id: uuidv4(),
             deckRequestId: orderId,
             quantity: item.quantity,
             cardName: item.cardName,
             parseConfidence: item.parseConfidence,
             lineRaw: item.lineRaw,
             createdAt: now,
-          }).run();
-        }
-
-        // Fetch the created order and items within transaction
-        const order = db.select().from(deckRequests).where(eq(deckRequests.id, orderId)).get()!;
-        const items = db.select().from(deckLineItems).where(eq(deckLineItems.deckRequestId, orderId)).all();
+          }))
+        ).returning().all();
 
         return { order, lineItems: items };
       })();
@@ -127,16 +122,19 @@ export function getOrderByNumberAndEmail(orderNumber: string, email: string): De
 export function getOrderLineItems(orderId: string, email: string): DeckLineItem[] {
   const db = getDatabase();
 
-  // Verify order exists and email matches
-  const order = db.select().from(deckRequests).where(eq(deckRequests.id, orderId)).get();
-  if (!order || order.email.toLowerCase() !== email.toLowerCase()) {
-    return [];
-  }
-
-  return db.select()
+  // Join against the order so the email check and item fetch are one query
+  const rows = db.select({ item: deckLineItems })
     .from(deckLineItems)
-    .where(eq(deckLineItems.deckRequestId, orderId))
+    .innerJoin(deckRequests, eq(deckRequests.id, deckLineItems.deckRequestId))
+    .where(
+      and(
+        eq(deckRequests.id, orderId),
+        eq(deckRequests.email, email.toLowerCase())
+      )
+    )
     .all();
+
+  return rows.map(row => row.item);
 }
 
 interface GetOrdersOptions {
@@ -145,33 +143,37 @@ interface GetOrdersOptions {
   status?: RequestStatus;
 }
 
+// The dashboard list never shows the raw decklist, which is by far the largest column
+const { rawDecklist: _rawDecklist, ...orderListColumns } = getTableColumns(deckRequests);
+
+export type DeckRequestSummary = Omit<DeckRequest, 'rawDecklist'>;
+
 interface PaginatedOrders {
-  orders: DeckRequest[];
+  orders: DeckRequestSummary[];
   total: number;
   limit: number;
   offset: number;
 }
 
 export function getAllOrders(options: GetOrdersOptions = {}): PaginatedOrders {
-  const sqliteDb = getSqlite();
   const db = getDatabase();
   const { limit = 50, offset = 0, status } = options;
 
   // Efficient count using raw SQL instead of fetching all rows
   const countRow = status
-    ? sqliteDb.prepare('SELECT COUNT(*) as total FROM deck_requests WHERE status = ?').get(status) as { total: number }
-    : sqliteDb.prepare('SELECT COUNT(*) as total FROM deck_requests').get() as { total: number };
+    ? getStatement('SELECT COUNT(*) as total FROM deck_requests WHERE status = ?').get(status) as { total: number }
+    : getStatement('SELECT COUNT(*) as total FROM deck_requests').get() as { total: number };
   const total = countRow.total;
 
   // Get paginated results
   const orders = status
-    ? db.select().from(deckRequests)
+    ? db.select(orderListColumns).from(deckRequests)
         .where(eq(deckRequests.status, status))
         .orderBy(desc(deckRequests.createdAt))
         .limit(limit)
         .offset(offset)
         .all()
-    : db.select().from(deckRequests)
+    : db.select(orderListColumns).from(deckRequests)
         .orderBy(desc(deckRequests.createdAt))
         .limit(limit)
         .offset(offset)
@@ -187,11 +189,34 @@ export function getOrderById(orderId: string): DeckRequest | undefined {
 
 export function getOrderWithItems(orderId: string): { order: DeckRequest; lineItems: DeckLineItem[] } | undefined {
   const db = getDatabase();
-  const order = db.select().from(deckRequests).where(eq(deckRequests.id, orderId)).get();
-  if (!order) return undefined;
+  const result = db.query.deckRequests.findFirst({
+    where: eq(deckRequests.id, orderId),
+    with: { lineItems: true },
+  }).sync();
+  if (!result) return undefined;
+
+  const { lineItems, ...order } = result;
+  return { order, lineItems };
+}
+
+export function getOrdersWithItems(orderIds: string[]): Map<string, { order: DeckRequest; lineItems: DeckLineItem[] }> {
+  const db = getDatabase();
+  const results = new Map<string, { order: DeckRequest; lineItems: DeckLineItem[] }>();
+  if (orderIds.length === 0) return results;
+
+  // One query for the orders and one for all of their items, instead of two per order
+  const uniqueIds = [...new Set(orderIds)];
+  const orders = db.select().from(deckRequests).where(inArray(deckRequests.id, uniqueIds)).all();
+  for (const order of orders) {
+    results.set(order.id, { order, lineItems: [] });
+  }
 
-  const items = db.select().from(deckLineItems).where(eq(deckLineItems.deckRequestId, orderId)).all();
-  return { order, lineItems: items };
+  const items = db.select().from(deckLineItems).where(inArray(deckLineItems.deckRequestId, uniqueIds)).all();
+  for (const item of items) {
+    results.get(item.deckRequestId)?.lineItems.push(item);
+  }
+
+  return results;
 }
 
 interface UpdateOrderInput {
@@ -201,7 +226,8 @@ interface UpdateOrderInput {
   missingItems?: string;
 }
 
-export function updateOrder(orderId: string, updates: UpdateOrderInput): DeckRequest | undefined {
+// Callers that already loaded the order can pass it in to skip re-reading it
+export function updateOrder(orderId: string, updates: UpdateOrderInput, existing?: DeckRequest): DeckRequest | undefined {
   const db = getDatabase();
   const now = new Date().toISOString();
 
@@ -210,7 +236,7 @@ export function updateOrder(orderId: string, updates: UpdateOrderInput): DeckReq
   };
 
   if (updates.status !== undefined) {
-    const currentOrder = db.select().from(schema.deckRequests).where(eq(schema.deckRequests.id, orderId)).get();
+    const currentOrder = existing ?? db.select().from(schema.deckRequests).where(eq(schema.deckRequests.id, orderId)).get();
     if (currentOrder) {
       const allowed = VALID_TRANSITIONS[currentOrder.status] || [];
       if (!allowed.includes(updates.status)) {
@@ -230,12 +256,11 @@ export function updateOrder(orderId: string, updates: UpdateOrderInput): DeckReq
   if (updates.estimatedTotal !== undefined) updateData.estimatedTotal = updates.estimatedTotal;
   if (updates.missingItems !== undefined) updateData.missingItems = updates.missingItems;
 
-  db.update(deckRequests)
+  return db.update(deckRequests)
     .set(updateData)
     .where(eq(deckRequests.id, orderId))
-    .run();
-
-  return db.select().from(deckRequests).where(eq(deckRequests.id, orderId)).get();
+    .returning()
+    .get();
 }
 
 interface UpdateLineItemInput {
@@ -255,12 +280,45 @@ export function updateLineItem(itemId: string, updates: UpdateLineItemInput): De
   if (updates.conditionVariants !== undefined) updateData.conditionVariants = updates.conditionVariants;
   if (updates.cardName !== undefined) updateData.cardName = updates.cardName;
 
-  db.update(deckLineItems)
+  // Empty SET clauses are invalid SQL, so fall back to a plain read
+  if (Object.keys(updateData).length === 0) {
+    return db.select().from(deckLineItems).where(eq(deckLineItems.id, itemId)).get();
+  }
+
+  return db.update(deckLineItems)
     .set(updateData)
     .where(eq(deckLineItems.id, itemId))
-    .run();
+    .returning()
+    .get();
+}
 
-  return db.select().from(deckLineItems).where(eq(deckLineItems.id, itemId)).get();
+interface BulkUpdateLineItemInput extends UpdateLineItemInput {
+  id: string;
+}
+
+export function updateLineItems(orderId: string, updates: BulkUpdateLineItemInput[]): DeckLineItem[] {
+  const db = getDatabase();
+  const sqliteDb = getSqlite();
+
+  // Apply every item update in one transaction so the batch shares a single commit
+  sqliteDb.transaction(() => {
+    for (const { id, ...fields } of updates) {
+      const updateData: Partial<NewDeckLineItem> = {};
+
+      if (fields.quantityFound !== undefined) updateData.quantityFound = fields.quantityFound;
+      if (fields.unitPrice !== undefined) updateData.unitPrice = fields.unitPrice;
+      if (fields.conditionVariants !== undefined) updateData.conditionVariants = fields.conditionVariants;
+      if (fields.cardName !== undefined) updateData.cardName = fields.cardName;
+      if (Object.keys(updateData).length === 0) continue;
+
+      db.update(deckLineItems)
+        .set(updateData)
+        .where(and(eq(deckLineItems.id, id), eq(deckLineItems.deckRequestId, orderId)))
+        .run();
+    }
+  })();
+
+  return getLineItemsByOrderId(orderId);
 }
 
 export function deleteLineItem(itemId: string): boolean {
@@ -274,6 +332,19 @@ export function getLineItemById(itemId: string): DeckLineItem | undefined {
   return db.select().from(deckLineItems).where(eq(deckLineItems.id, itemId)).get();
 }
 
+export function getOrderLineItem(orderId: string, itemId: string): { order: DeckRequest; lineItem: DeckLineItem | null } | undefined {
+  const db = getDatabase();
+  // Left join so a missing order and an item from another order are distinguishable in one query
+  return db.select({ order: deckRequests, lineItem: deckLineItems })
+    .from(deckRequests)
+    .leftJoin(deckLineItems, and(
+      eq(deckLineItems.id, itemId),
+      eq(deckLineItems.deckRequestId, deckRequests.id)
+    ))
+    .where(eq(deckRequests.id, orderId))
+    .get();
+}
+
 export function getLineItemsByOrderId(orderId: string): DeckLineItem[] {
   const db = getDatabase();
   return db.select().from(deckLineItems).where(eq(deckLineItems.deckRequestId, orderId)).all();
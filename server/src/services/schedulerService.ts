@@ -4,22 +4,35 @@ import { sendDailyDigest, checkStaleOrders } from './discordService.js';
 let lastDigestDate = '';
 let lastStaleCheck = 0;
 
+let formatters: { timezone: string; hour: Intl.DateTimeFormat; date: Intl.DateTimeFormat } | null = null;
+
+// Formatters are cached per timezone instead of rebuilt every tick
+function getFormatters(timezone: string) {
+  if (!formatters || formatters.timezone !== timezone) {
+    formatters = {
+      timezone,
+      hour: new Intl.DateTimeFormat('en-US', {
+        timeZone: timezone,
+        hour: 'numeric',
+        hour12: false,
+      }),
+      date: new Intl.DateTimeFormat('en-US', {
+        timeZone: timezone,
+        year: 'numeric',
+        month: '2-digit',
+        day: '2-digit',
+      }),
+    };
+  }
+  return formatters;
+}
+
 function getCurrentHourInTimezone(timezone: string): { hour: number; dateStr: string } {
   const now = new Date();
-  const hourFormatter = new Intl.DateTimeFormat('en-US', {
-    timeZone: timezone,
-    hour: 'numeric',
-    hour12: false,
-  });
-  const dateFormatter = new Intl.DateTimeFormat('en-US', {
-    timeZone: timezone,
-    year: 'numeric',
-    month: '2-digit',
-    day: '2-digit',
-  });
+  const { hour, date } = getFormatters(timezone);
   return {
-    hour: parseInt(hourFormatter.format(now), 10),
-    dateStr: dateFormatter.format(now),
+    hour: parseInt(hour.format(now), 10),
+    dateStr: date.format(now),
   };
 }
 
@@ -2,8 +2,9 @@ import { sendEmail } from './emailService.js';
 import { config } from '../config.js';
 import { escapeHtml } from '../utils/html.js';
 
+const safeStoreName = escapeHtml(config.store.name);
+
 export async function sendWelcomeEmail(email: string, loginUrl: string): Promise<boolean> {
-  const safeStoreName = escapeHtml(config.store.name);
   const safeLoginUrl = escapeHtml(loginUrl);
 
   const html = `
@@ -43,7 +44,6 @@ export async function sendWelcomeEmail(email: string, loginUrl: string): Promise
 }
 
 export async function sendPasswordResetEmail(email: string, resetUrl: string): Promise<boolean> {
-  const safeStoreName = escapeHtml(config.store.name);
   const safeResetUrl = escapeHtml(resetUrl);
 
   const html = `
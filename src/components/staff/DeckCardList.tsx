@@ -221,48 +221,36 @@ export function DeckCardList({ lineItems, game, deckRequestId, customerName, ord
     setSaving(true);
 
     try {
-      // Build update requests for all items
+      // Send every item's inventory in a single request
       const updates = localItems.map(item => {
         const inv = inventoryState.get(item.id);
         const variants = inv?.conditionVariants || [];
         return {
           id: item.id,
-          promise: api.staff.updateLineItem(deckRequestId, item.id, {
-            quantityFound: inv?.quantityFound ?? undefined,
-            unitPrice: inv?.unitPrice ?? undefined,
-            conditionVariants: variants.length > 0 ? JSON.stringify(variants) : undefined,
-          }),
+          quantityFound: inv?.quantityFound ?? undefined,
+          unitPrice: inv?.unitPrice ?? undefined,
+          conditionVariants: variants.length > 0 ? JSON.stringify(variants) : undefined,
         };
       });
 
-      const results = await Promise.allSettled(updates.map(u => u.promise));
+      await api.staff.updateLineItems(deckRequestId, updates);
 
-      const failures = results.filter(r => r.status === 'rejected');
+      // Calculate totals for the deck_requests table
+      const estimatedTotal = inventorySummary.hasAnyPrice ? inventorySummary.manualTotal : undefined;
+      const missingItems = inventorySummary.missingItemsList.length > 0
+        ? inventorySummary.missingItemsList.join(', ')
+        : undefined;
 
-      if (failures.length === 0) {
-        // Calculate totals for the deck_requests table
-        const estimatedTotal = inventorySummary.hasAnyPrice ? inventorySummary.manualTotal : undefined;
-        const missingItems = inventorySummary.missingItemsList.length > 0
-          ? inventorySummary.missingItemsList.join(', ')
-          : undefined;
-
-        await api.staff.updateOrder(deckRequestId, {
-          estimatedTotal,
-          missingItems,
-        });
+      await api.staff.updateOrder(deckRequestId, {
+        estimatedTotal,
+        missingItems,
+      });
 
-        toast.success(`Saved ${updates.length} card${updates.length === 1 ? '' : 's'}`);
-        onInventorySaved?.(estimatedTotal ?? null, missingItems ?? null);
-      } else if (failures.length === updates.length) {
-        toast.error('Failed to save all changes. Check your connection and try again.');
-      } else {
-        const savedCount = updates.length - failures.length;
-        toast.warning(`Saved ${savedCount} cards, but ${failures.length} failed. Try saving again.`);
-        onInventorySaved?.(null, null);
-      }
+      toast.success(`Saved ${updates.length} card${updates.length === 1 ? '' : 's'}`);
+      onInventorySaved?.(estimatedTotal ?? null, missingItems ?? null);
     } catch (err) {
       console.error('Failed to save inventory:', err);
-      toast.error('Unexpected error saving inventory');
+      toast.error('Failed to save changes. Check your connection and try again.');
     } finally {
       setSaving(false);
     }
@@ -9,9 +9,12 @@ import type {
   UpdateOrderResponse,
   UpdateLineItemResponse,
   PokemonTcgResponse,
+  PokemonTcgBatchResponse,
+  PokemonTcgCard,
   SubmitOrderInput,
   UpdateOrderInput,
   UpdateLineItemInput,
+  BulkUpdateLineItemInput,
   GetOrdersParams,
   DeckRequest,
   DeckLineItem,
@@ -224,6 +227,20 @@ export const staff = {
     return response.lineItem;
   },
 
+  async updateLineItems(
+    orderId: string,
+    items: BulkUpdateLineItemInput[]
+  ): Promise<DeckLineItem[]> {
+    const response = await apiFetch<OrderLineItemsResponse>(
+      `/staff/orders/${orderId}/items`,
+      {
+        method: 'PATCH',
+        body: JSON.stringify({ items }),
+      }
+    );
+    return response.lineItems;
+  },
+
   async deleteLineItem(orderId: string, itemId: string): Promise<void> {
     await apiFetch<{ success: boolean }>(`/staff/orders/${orderId}/items/${itemId}`, {
       method: 'DELETE',
@@ -274,6 +291,15 @@ export const pokemonTcg = {
       `/proxy/pokemon-tcg?action=card&id=${encodeURIComponent(id)}`
     );
   },
+
+  // Requires staff auth
+  async batchSearch(queries: string[]): Promise<Record<string, PokemonTcgCard[]>> {
+    const response = await apiFetch<PokemonTcgBatchResponse>('/proxy/pokemon-tcg/batch', {
+      method: 'POST',
+      body: JSON.stringify({ queries }),
+    });
+    return response.results;
+  },
 };
 
 // Default export with all APIs
@@ -117,8 +117,11 @@ export interface OrderWithItemsResponse {
   lineItems: DeckLineItem[];
 }
 
+// List responses omit the raw decklist; fetch the order itself to get it
+export type DeckRequestSummary = Omit<DeckRequest, 'rawDecklist'>;
+
 export interface OrdersListResponse {
-  orders: DeckRequest[];
+  orders: DeckRequestSummary[];
   total: number;
   limit: number;
   offset: number;
@@ -151,6 +154,10 @@ export interface PokemonTcgResponse {
   cards: PokemonTcgCard[];
 }
 
+export interface PokemonTcgBatchResponse {
+  results: Record<string, PokemonTcgCard[]>;
+}
+
 // Input types
 export interface LineItemInput {
   quantity: number;
@@ -185,3 +192,7 @@ export interface UpdateLineItemInput {
   conditionVariants?: string;
   cardName?: string;
 }
+
+export interface BulkUpdateLineItemInput extends UpdateLineItemInput {
+  id: string;
+}
@@ -0,0 +1,23 @@
+// Size-capped cache for API results, e.g. autocomplete suggestions per query,
+// so retyping or re-focusing a field doesn't refetch. Evicts the oldest entry first.
+export class BoundedCache<V> {
+  private entries = new Map<string, V>();
+  private maxSize: number;
+
+  constructor(maxSize: number) {
+    this.maxSize = maxSize;
+  }
+
+  get(key: string): V | undefined {
+    return this.entries.get(key);
+  }
+
+  set(key: string, value: V) {
+    this.entries.set(key, value);
+    // Map preserves insertion order, so the first key is the oldest
+    if (this.entries.size > this.maxSize) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) this.entries.delete(oldest);
+    }
+  }
+}
@@ -28,27 +28,23 @@ const PATTERNS = [
   /^(?:SB:|Sideboard:?\s*)?(\d+)\s*[xX]?\s+(.+)$/i,
 ];
 
-// Lines to ignore
-const IGNORE_PATTERNS = [
-  /^\/\//,           // Comments
-  /^#/,              // Comments
-  /^Deck$/i,         // Section headers
-  /^Sideboard$/i,
-  /^Mainboard$/i,
-  /^Main$/i,
-  /^Commander$/i,
-  /^Companion$/i,
-  /^\s*$/,           // Empty lines
-];
+// Section headers to ignore (matched case-insensitively as whole lines)
+const IGNORED_HEADERS = new Set(['deck', 'sideboard', 'mainboard', 'main', 'commander', 'companion']);
+
+// Plain string checks instead of running a regex per ignore rule on every line
+function isIgnoredLine(trimmedLine: string): boolean {
+  return trimmedLine.length === 0 ||           // Empty lines
+    trimmedLine.startsWith('//') ||            // Comments
+    trimmedLine.startsWith('#') ||             // Comments
+    IGNORED_HEADERS.has(trimmedLine.toLowerCase());
+}
 
 export function parseDecklistLine(line: string): ParsedCard | null {
   const trimmedLine = line.trim();
   
   // Check if line should be ignored
-  for (const pattern of IGNORE_PATTERNS) {
-    if (pattern.test(trimmedLine)) {
-      return null;
-    }
+  if (isIgnoredLine(trimmedLine)) {
+    return null;
   }
 
   // Try each pattern
@@ -97,37 +93,35 @@ export function parseDecklistLine(line: string): ParsedCard | null {
 
 export function parseDecklist(rawText: string): ParseResult {
   const lines = rawText.split('\n');
-  const cards: ParsedCard[] = [];
   const errors: string[] = [];
+  const consolidated = new Map<string, ParsedCard>();
+  let hasLowConfidence = false;
 
+  // Parse, collect errors and consolidate duplicate cards in a single pass
   for (const line of lines) {
     const parsed = parseDecklistLine(line);
-    if (parsed) {
-      cards.push(parsed);
-      if (parsed.error) {
-        errors.push(`Line "${line.trim()}": ${parsed.error}`);
-      }
+    if (!parsed) continue;
+
+    if (parsed.error) {
+      errors.push(`Line "${line.trim()}": ${parsed.error}`);
     }
-  }
+    if (parsed.parseConfidence < 1) hasLowConfidence = true;
 
-  // Consolidate duplicate cards
-  const consolidated = new Map<string, ParsedCard>();
-  for (const card of cards) {
-    const key = card.cardName.toLowerCase();
-    if (consolidated.has(key)) {
-      const existing = consolidated.get(key)!;
-      existing.quantity += card.quantity;
+    const key = parsed.cardName.toLowerCase();
+    const existing = consolidated.get(key);
+    if (existing) {
+      existing.quantity += parsed.quantity;
       // Keep the lower confidence if combining
-      existing.parseConfidence = Math.min(existing.parseConfidence, card.parseConfidence);
+      existing.parseConfidence = Math.min(existing.parseConfidence, parsed.parseConfidence);
     } else {
-      consolidated.set(key, { ...card });
+      consolidated.set(key, parsed);
     }
   }
 
   return {
     cards: Array.from(consolidated.values()),
     errors,
-    hasErrors: errors.length > 0 || cards.some(c => c.parseConfidence < 1),
+    hasErrors: errors.length > 0 || hasLowConfidence,
   };
 }
 
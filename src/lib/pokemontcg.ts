@@ -2,9 +2,18 @@
 // Uses TCGdex API via backend proxy
 
 import { CONFIG } from './config';
-import { pokemonLimiter, chunk, delay } from './rateLimiter';
+import { pokemonLimiter, chunk } from './rateLimiter';
+import { BoundedCache } from './cache';
+import api from '@/integrations/api/client';
 
 const POKEMON_PROXY_URL = `${CONFIG.api.baseUrl}/proxy/pokemon-tcg`;
+// Fixed prefix for name searches; only the query needs encoding per call
+const POKEMON_SEARCH_URL = `${POKEMON_PROXY_URL}?action=search&query=`;
+// Matches the proxy's per-request limit on batch searches
+const POKEMON_BATCH_LIMIT = 100;
+
+const autocompleteCache = new BoundedCache<string[]>(200);
+
 // External card page (free, stable URLs by TCGdex card id)
 const DEX_TCG_CARD_BASE_URL = 'https://dextcg.com/cards';
 const DEX_TCG_SEARCH_URL = 'https://dextcg.com/search';
@@ -81,14 +90,15 @@ export async function autocompleteCardName(query: string): Promise<string[]> {
     return [];
   }
 
+  const cacheKey = query.toLowerCase();
+  const cached = autocompleteCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
+
   return pokemonLimiter.execute(async () => {
     try {
-      const params = new URLSearchParams({
-        action: 'search',
-        query: query,
-      });
-
-      const response = await fetch(`${POKEMON_PROXY_URL}?${params}`);
+      const response = await fetch(`${POKEMON_SEARCH_URL}${encodeURIComponent(query)}`);
 
       if (!response.ok) {
         return [];
@@ -107,8 +117,9 @@ export async function autocompleteCardName(query: string): Promise<string[]> {
       });
 
       // Remove duplicates (same card + set combo)
-      const uniqueSuggestions = [...new Set(suggestions)];
-      return uniqueSuggestions.slice(0, 10);
+      const uniqueSuggestions = [...new Set(suggestions)].slice(0, 10);
+      autocompleteCache.set(cacheKey, uniqueSuggestions);
+      return uniqueSuggestions;
     } catch (error) {
       console.error('Pokemon TCG autocomplete error:', error);
       return [];
@@ -116,6 +127,19 @@ export async function autocompleteCardName(query: string): Promise<string[]> {
   });
 }
 
+// Prefer the card from the requested set, then an exact name match, then the first result
+function pickBestMatch(cardName: string, searchName: string, cards: PokemonApiCard[]): PokemonApiCard {
+  const setMatch = cardName.match(/\(([^)]+)\)$/);
+  if (setMatch) {
+    const setId = setMatch[1].toLowerCase();
+    const matchingCard = cards.find(c => c.id.toLowerCase().startsWith(setId));
+    if (matchingCard) return matchingCard;
+  }
+
+  const exactMatch = cards.find(c => c.name.toLowerCase() === searchName.toLowerCase());
+  return exactMatch || cards[0];
+}
+
 /**
  * Fetch card data from TCGdex API using exact name matching
  * Rate limited to prevent overwhelming the proxy
@@ -126,12 +150,7 @@ export async function fetchCardData(cardName: string): Promise<PokemonCard | nul
       // Strip set identifier before searching
       const searchName = stripSetIdentifierFromName(cardName);
 
-      const params = new URLSearchParams({
-        action: 'search',
-        query: searchName,
-      });
-
-      const response = await fetch(`${POKEMON_PROXY_URL}?${params}`);
+      const response = await fetch(`${POKEMON_SEARCH_URL}${encodeURIComponent(searchName)}`);
 
       if (!response.ok) {
         return null;
@@ -143,17 +162,7 @@ export async function fetchCardData(cardName: string): Promise<PokemonCard | nul
         return null;
       }
 
-      // If original name had a set identifier, try to match it
-      const setMatch = cardName.match(/\(([^)]+)\)$/);
-      if (setMatch) {
-        const setId = setMatch[1].toLowerCase();
-        const matchingCard = data.cards.find(c => c.id.toLowerCase().startsWith(setId));
-        if (matchingCard) return mapApiCard(matchingCard);
-      }
-
-      // Find exact name match or first result
-      const exactMatch = data.cards.find(c => c.name.toLowerCase() === searchName.toLowerCase());
-      return mapApiCard(exactMatch || data.cards[0]);
+      return mapApiCard(pickBestMatch(cardName, searchName, data.cards));
     } catch (error) {
       console.error('Pokemon TCG API error:', error);
       return null;
@@ -162,9 +171,9 @@ export async function fetchCardData(cardName: string): Promise<PokemonCard | nul
 }
 
 /**
- * Batch fetch card data with parallel processing
+ * Batch fetch card data through the proxy's batch search endpoint
  * TCGdex doesn't have pricing, returns card info only
- * Uses batching to avoid overwhelming the API while still being faster than sequential
+ * Sends up to 100 names per request instead of one request per card
  */
 export async function fetchCardPrices(
   cardNames: string[]
@@ -173,36 +182,31 @@ export async function fetchCardPrices(
 
   const uniqueNames = [...new Set(cardNames.map(n => n.toLowerCase()))];
 
-  // Process in batches of 5 for parallel execution
-  const BATCH_SIZE = 5;
-  const batches = chunk(uniqueNames, BATCH_SIZE);
-
-  for (let i = 0; i < batches.length; i++) {
-    const batch = batches[i];
-
-    // Add delay between batches (not for first batch)
-    if (i > 0) {
-      await delay(CONFIG.api.pokemonRateLimitMs);
+  for (const batch of chunk(uniqueNames, POKEMON_BATCH_LIMIT)) {
+    // A Map, so card names like "constructor" can't resolve to prototype members
+    let searchResults = new Map<string, PokemonApiCard[]>();
+
+    // Skip names that strip down to nothing (e.g. "(SVI)") so they can't fail the whole batch
+    const queries = [...new Set(batch.map(stripSetIdentifierFromName))].filter(q => q.length > 0);
+
+    if (queries.length > 0) {
+      try {
+        // Batch search is staff-only, so go through the authenticated API client
+        const response = await pokemonLimiter.execute(() =>
+          api.pokemonTcg.batchSearch(queries)
+        );
+        searchResults = new Map(Object.entries(response));
+      } catch (error) {
+        console.error('Pokemon TCG fetch error:', error);
+      }
     }
 
-    // Fetch batch in parallel
-    const batchResults = await Promise.all(
-      batch.map(async (name) => {
-        try {
-          const card = await fetchCardData(name);
-          return { name, card };
-        } catch (error) {
-          console.error('Pokemon TCG fetch error:', error);
-          return { name, card: null };
-        }
-      })
-    );
-
-    // Store results
-    for (const { name, card } of batchResults) {
+    for (const name of batch) {
+      const searchName = stripSetIdentifierFromName(name);
+      const cards = searchResults.get(searchName) || [];
       results.set(name, {
         usd: null, // TCGdex doesn't provide pricing
-        card: card,
+        card: cards.length > 0 ? mapApiCard(pickBestMatch(name, searchName, cards)) : null,
       });
     }
   }
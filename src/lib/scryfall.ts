@@ -1,9 +1,15 @@
 // Scryfall API utilities for Magic: The Gathering cards
 
-import { scryfallLimiter } from './rateLimiter';
+import { CONFIG } from './config';
+import { scryfallLimiter, chunk, delay } from './rateLimiter';
+import { BoundedCache } from './cache';
 
 const SCRYFALL_BASE_URL = 'https://scryfall.com';
 const SCRYFALL_API_URL = 'https://api.scryfall.com';
+// Maximum identifiers accepted per /cards/collection request
+const SCRYFALL_COLLECTION_LIMIT = 75;
+
+const autocompleteCache = new BoundedCache<string[]>(200);
 
 /**
  * Generate a Scryfall search URL for a card name
@@ -105,6 +111,12 @@ export async function autocompleteCardName(query: string): Promise<string[]> {
     return [];
   }
 
+  const cacheKey = query.toLowerCase();
+  const cached = autocompleteCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
+
   return scryfallLimiter.execute(async () => {
     try {
       const response = await fetch(
@@ -116,7 +128,9 @@ export async function autocompleteCardName(query: string): Promise<string[]> {
       }
 
       const data: ScryfallAutocompleteResult = await response.json();
-      return data.data || [];
+      const suggestions = data.data || [];
+      autocompleteCache.set(cacheKey, suggestions);
+      return suggestions;
     } catch (error) {
       console.error('Scryfall autocomplete error:', error);
       return [];
@@ -159,15 +173,12 @@ export async function validateCardName(cardName: string): Promise<{ valid: boole
 }
 
 /**
- * Batch fetch card prices (respects Scryfall rate limits)
- * Uses the collection endpoint for efficiency - NOT rate limited since it's a single call
+ * Fetch one collection batch and add its cards to the results map
  */
-export async function fetchCardPrices(
-  cardNames: string[]
-): Promise<Map<string, { usd: string | null; card: ScryfallCard | null }>> {
-  const results = new Map<string, { usd: string | null; card: ScryfallCard | null }>();
-
-  // Scryfall collection endpoint accepts up to 75 cards at once
+async function fetchCollectionBatch(
+  cardNames: string[],
+  results: Map<string, { usd: string | null; card: ScryfallCard | null }>
+): Promise<void> {
   const identifiers = cardNames.map(name => ({ name }));
 
   try {
@@ -180,7 +191,7 @@ export async function fetchCardPrices(
     });
 
     if (!response.ok) {
-      return results;
+      return;
     }
 
     const data = await response.json();
@@ -205,6 +216,28 @@ export async function fetchCardPrices(
   } catch (error) {
     console.error('Scryfall collection fetch error:', error);
   }
+}
+
+/**
+ * Batch fetch card prices using the collection endpoint
+ * Decks larger than the 75-card collection limit are split into batches that run
+ * concurrently, with start times staggered to stay within Scryfall's rate limit
+ */
+export async function fetchCardPrices(
+  cardNames: string[]
+): Promise<Map<string, { usd: string | null; card: ScryfallCard | null }>> {
+  const results = new Map<string, { usd: string | null; card: ScryfallCard | null }>();
+
+  const batches = chunk(cardNames, SCRYFALL_COLLECTION_LIMIT);
+
+  await Promise.all(
+    batches.map(async (batch, i) => {
+      if (i > 0) {
+        await delay(i * CONFIG.api.scryfallRateLimitMs);
+      }
+      await fetchCollectionBatch(batch, results);
+    })
+  );
 
   return results;
 }
@@ -23,6 +23,9 @@ export interface DeckRequest {
   missingItems: string | null;
 }
 
+// Order as returned by the staff list endpoint, which omits the raw decklist
+export type DeckRequestSummary = Omit<DeckRequest, 'rawDecklist'>;
+
 export interface ConditionVariant {
   condition: string;
   quantity: number;
@@ -15,7 +15,7 @@ import { GameBadge } from '@/components/GameBadge';
 import { useAuth } from '@/hooks/useAuth';
 import api from '@/integrations/api/client';
 import { CONFIG } from '@/lib/config';
-import type { DeckRequest, RequestStatus, GameType } from '@/lib/types';
+import type { DeckRequestSummary, RequestStatus, GameType } from '@/lib/types';
 
 // Map API response to frontend type
 function mapApiOrdersToFrontend(apiOrders: Array<{
@@ -29,21 +29,20 @@ function mapApiOrdersToFrontend(apiOrders: Array<{
   format: string | null;
   pickupWindow: string | null;
   notes: string | null;
-  rawDecklist: string;
   status: string;
   staffNotes: string | null;
   estimatedTotal: number | null;
   missingItems: string | null;
   createdAt: string;
   updatedAt: string;
-}>): DeckRequest[] {
-  return apiOrders as DeckRequest[];
+}>): DeckRequestSummary[] {
+  return apiOrders as DeckRequestSummary[];
 }
 
 export default function StaffDashboard() {
   const navigate = useNavigate();
   const { user, isStaff, isAdmin, signOut, loading: authLoading } = useAuth();
-  const [requests, setRequests] = useState<DeckRequest[]>([]);
+  const [requests, setRequests] = useState<DeckRequestSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [searchQuery, setSearchQuery] = useState('');